@@ -1,9 +1,19 @@
 import streamlit as st
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, text, bindparam
+from sqlalchemy.pool import NullPool
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+import pyarrow as pa
 import os
+import sqlite3
+import tempfile
+import time
+import json
+import base64
+import hashlib
+import functools
 from datetime import datetime
 import re
 # import textwrap # New import for text wrapping
@@ -37,17 +47,416 @@ apply_custom_css('styles.css')
 px.defaults.template = "plotly_dark"
 
 # --- Database Connection ---
+DB_PATH = 'model_results.db'
+
 @st.cache_resource
 def get_db_engine():
     """Returns a SQLAlchemy engine for the F1 results database."""
     # Using 'model_results.db' as specified in your query examples
-    return create_engine('sqlite:///model_results.db')
+    return create_engine(f'sqlite:///{DB_PATH}')
 
 engine = get_db_engine()
 
+# --- Shared Cross-Process Cache ---
+# st.cache_data only lives inside one Streamlit process, so every replica behind
+# the load balancer would otherwise recompute the same frames and figures.
+# This tier sits underneath st.cache_data and is shared through a file on disk.
+SHARED_CACHE_BACKEND = os.environ.get('F1METRIX_SHARED_CACHE_BACKEND', 'sqlite')
+SHARED_CACHE_PATH = os.environ.get('F1METRIX_SHARED_CACHE_PATH', '.cache/shared_results_cache.db')
+SHARED_CACHE_MAX_MB = float(os.environ.get('F1METRIX_SHARED_CACHE_MAX_MB', '256'))
+
+
+@functools.lru_cache(maxsize=8)
+def hash_db_file(path, mtime_ns, size):
+    """Hashes the database file; mtime and size are only there to key the memoization."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def get_db_version():
+    """
+    Returns a token identifying the current contents of the results database.
+    It is a hash of the file, so replicas with their own copy of the same DB
+    get the same token. The file is only re-hashed when its mtime or size changes.
+    """
+    try:
+        stat = os.stat(DB_PATH)
+        return hash_db_file(DB_PATH, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return 'missing'
+
+
+def encode_cache_value(value):
+    """Serializes a result into (kind, bytes): Arrow IPC for frames, JSON for figures."""
+    if isinstance(value, pd.DataFrame):
+        table = pa.Table.from_pandas(value)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return 'frame', sink.getvalue().to_pybytes()
+    if isinstance(value, go.Figure):
+        return 'figure', value.to_json().encode('utf-8')
+    if isinstance(value, dict):
+        # Post renderers return a dict of named figures/tables
+        bundle = {}
+        for name, element in value.items():
+            kind, payload = encode_cache_value(element)
+            bundle[name] = [kind, base64.b64encode(payload).decode('ascii')]
+        return 'bundle', json.dumps(bundle).encode('utf-8')
+    raise TypeError(f"Cannot store values of type {type(value).__name__} in the shared cache.")
+
+
+def decode_cache_value(kind, payload):
+    """Inverse of encode_cache_value."""
+    if kind == 'frame':
+        with pa.ipc.open_stream(payload) as reader:
+            return reader.read_all().to_pandas()
+    if kind == 'figure':
+        return pio.from_json(payload.decode('utf-8'))
+    if kind == 'bundle':
+        bundle = json.loads(payload.decode('utf-8'))
+        return {name: decode_cache_value(k, base64.b64decode(data)) for name, (k, data) in bundle.items()}
+    raise ValueError(f"Unknown shared cache entry kind '{kind}'.")
+
+
+class SQLiteResultCache:
+    """
+    Size-bounded result cache stored in a single SQLite file. WAL mode lets
+    several processes read concurrently while one writes; least recently used
+    entries are evicted once the total payload exceeds max_bytes. Hits only
+    refresh last_access when it is older than LAST_ACCESS_REFRESH_SECONDS, so
+    most reads never take the write lock.
+    """
+
+    LAST_ACCESS_REFRESH_SECONDS = 60
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_results_last_access ON results (last_access)")
+        finally:
+            conn.close()
+
+    def _connect(self):
+        # A short-lived connection per call keeps this safe across Streamlit's script threads
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA busy_timeout=10000")
+        return conn
+
+    def get(self, key):
+        """Returns (kind, payload) for key, or None on a miss."""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT kind, payload, last_access FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            kind, payload, last_access = row
+            now = time.time()
+            if now - last_access > self.LAST_ACCESS_REFRESH_SECONDS:
+                try:
+                    conn.execute("UPDATE results SET last_access = ? WHERE key = ?", (now, key))
+                except sqlite3.OperationalError:
+                    # LRU bookkeeping is best effort; a busy writer shouldn't fail the hit
+                    pass
+            return kind, payload
+        finally:
+            conn.close()
+
+    def set(self, key, kind, payload):
+        """Stores an entry and evicts the least recently used ones beyond max_bytes."""
+        if len(payload) > self.max_bytes:
+            return
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, kind, payload, size, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, kind, payload, len(payload), time.time())
+            )
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            if total > self.max_bytes:
+                rows = conn.execute("SELECT key, size FROM results WHERE key != ? ORDER BY last_access", (key,)).fetchall()
+                for old_key, size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    conn.execute("DELETE FROM results WHERE key = ?", (old_key,))
+                    total -= size
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+
+# --- Dictionary mapping backend names to shared cache implementations ---
+SHARED_CACHE_BACKENDS = {
+    "sqlite": SQLiteResultCache,
+}
+
+@st.cache_resource
+def get_shared_cache():
+    """Returns the configured shared cache backend, or None when it is disabled."""
+    backend = SHARED_CACHE_BACKENDS.get(SHARED_CACHE_BACKEND)
+    if backend is None or not SHARED_CACHE_PATH:
+        return None
+    try:
+        return backend(SHARED_CACHE_PATH, int(SHARED_CACHE_MAX_MB * 1024 * 1024))
+    except Exception as e:
+        print(f"Shared cache disabled: {e}")
+        return None
+
+
+def shared_cache(func):
+    """
+    Caches a loader or figure builder in the shared cross-process cache.
+    Like st.cache_data, arguments starting with an underscore are left out of
+    the key, and the DB version is always added to it. Apply it underneath
+    @st.cache_data so each process still keeps its own in-memory copy; give the
+    function a db_version argument so that in-memory copy is also dropped when
+    the DB changes. Any cache failure falls back to computing the result.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = get_shared_cache()
+        if cache is None:
+            return func(*args, **kwargs)
+
+        arg_names = func.__code__.co_varnames[:func.__code__.co_argcount]
+        key_args = [repr(arg) for name, arg in zip(arg_names, args) if not name.startswith('_')]
+        key_args += [f"{name}={value!r}" for name, value in sorted(kwargs.items()) if not name.startswith('_')]
+        raw_key = f"{func.__module__}.{func.__qualname__}({', '.join(key_args)})@{get_db_version()}"
+        key = hashlib.sha256(raw_key.encode('utf-8')).hexdigest()
+
+        try:
+            entry = cache.get(key)
+            if entry is not None:
+                return decode_cache_value(*entry)
+        except Exception as e:
+            print(f"Shared cache read failed for {func.__qualname__}: {e}")
+
+        result = func(*args, **kwargs)
+        # Empty frames usually mean a load error, so don't share them
+        if isinstance(result, pd.DataFrame) and result.empty:
+            return result
+        try:
+            cache.set(key, *encode_cache_value(result))
+        except Exception as e:
+            print(f"Shared cache write failed for {func.__qualname__}: {e}")
+        return result
+
+    return wrapper
+
+# Recomputed on every rerun and passed to the cached loaders, so st.cache_data
+# entries are keyed on the DB contents too
+db_version = get_db_version()
+
+# --- Driver Search Index ---
+# Driver search and profiles are served from a sidecar SQLite file so the model
+# output in model_results.db is never written to. The sidecar holds copies of
+# the per-driver tables with driverid indexes, plus an FTS4 table over
+# forename, surname and driverid. It is rebuilt whenever the DB version changes.
+DRIVER_INDEX_PATH = os.environ.get('F1METRIX_DRIVER_INDEX_PATH', '.cache/driver_search_index.db')
+
+DRIVER_INDEX_STATEMENTS = [
+    "CREATE TABLE driver_all_time_u0_ranking_conservative AS SELECT * FROM results.driver_all_time_u0_ranking_conservative",
+    "CREATE TABLE driver_yearly_pure_skill_rankings AS SELECT * FROM results.driver_yearly_pure_skill_rankings",
+    "CREATE TABLE driver_performance_over_expectation AS SELECT * FROM results.driver_performance_over_expectation",
+    "CREATE INDEX idx_all_time_driverid ON driver_all_time_u0_ranking_conservative (driverid)",
+    "CREATE INDEX idx_yearly_skill_driverid_year ON driver_yearly_pure_skill_rankings (driverid, year)",
+    "CREATE INDEX idx_poe_driverid_year ON driver_performance_over_expectation (driverid, year)",
+    """
+    CREATE TABLE driver_search (
+        driverid TEXT PRIMARY KEY,
+        forename TEXT,
+        surname TEXT
+    )
+    """,
+    """
+    INSERT OR IGNORE INTO driver_search (driverid, forename, surname)
+    SELECT driverid, forename, surname FROM driver_all_time_u0_ranking_conservative
+    UNION
+    SELECT DISTINCT driverid, forename, surname FROM driver_yearly_pure_skill_rankings
+    UNION
+    SELECT DISTINCT driverid, forename, surname FROM driver_performance_over_expectation
+    """,
+    # External-content FTS4 table; unicode61 folds accents so 'perez' finds 'Pérez'
+    """
+    CREATE VIRTUAL TABLE driver_search_fts USING fts4(
+        content="driver_search", driverid, forename, surname,
+        tokenize=unicode61, prefix="1,2,3"
+    )
+    """,
+    "INSERT INTO driver_search_fts(driver_search_fts) VALUES('rebuild')",
+    "CREATE TABLE driver_index_meta (db_version TEXT NOT NULL)",
+]
+
+
+def read_driver_index_version(path):
+    """Returns the DB version a sidecar index was built from, or None if it is missing or unreadable."""
+    if not os.path.exists(path):
+        return None
+    try:
+        conn = sqlite3.connect(path)
+        try:
+            row = conn.execute("SELECT db_version FROM driver_index_meta").fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def write_driver_index(path, db_version):
+    """
+    Builds the sidecar index from DB_PATH into a temporary file and moves it into
+    place, so other processes only ever open a complete index.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path, isolation_level=None)
+    try:
+        conn.execute("ATTACH DATABASE ? AS results", (DB_PATH,))
+        conn.execute("BEGIN")
+        for statement in DRIVER_INDEX_STATEMENTS:
+            conn.execute(statement)
+        conn.execute("INSERT INTO driver_index_meta (db_version) VALUES (?)", (db_version,))
+        conn.execute("COMMIT")
+        conn.execute("DETACH DATABASE results")
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+
+
+@st.cache_resource
+def build_driver_search_index(db_version):
+    """
+    Makes sure a sidecar index for db_version exists and returns its path.
+    Falls back to the temp directory if DRIVER_INDEX_PATH is not writable, and
+    returns None when no index could be built, in which case driver search is unavailable.
+    """
+    fallback_path = os.path.join(tempfile.gettempdir(), 'f1metrix_driver_search_index.db')
+    for path in (DRIVER_INDEX_PATH, fallback_path):
+        try:
+            if read_driver_index_version(path) != db_version:
+                write_driver_index(path, db_version)
+            return path
+        except Exception as e:
+            print(f"Could not build driver search index at '{path}': {e}")
+    return None
+
+
+@st.cache_resource
+def get_driver_index_engine(path):
+    """Returns a SQLAlchemy engine for the sidecar driver index."""
+    # No pooling: a rebuilt index replaces the file, and new connections must see it
+    return create_engine(f'sqlite:///{path}', poolclass=NullPool)
+
+driver_index_path = build_driver_search_index(db_version)
+driver_index_engine = get_driver_index_engine(driver_index_path) if driver_index_path else None
+
+
+def build_fts_prefix_query(search_text):
+    """Turns free text into an FTS MATCH expression where every word is a prefix term."""
+    terms = re.findall(r'\w+', search_text)
+    return ' '.join(f'{term}*' for term in terms)
+
+
+@st.cache_data
+def search_drivers(_engine, search_text, limit=10, db_version=None):
+    """
+    Prefix autocomplete over driver names and ids. 'verst', 'max v' and
+    'perez' all match. Drivers with more races are listed first.
+    """
+    match_query = build_fts_prefix_query(search_text)
+    if _engine is None or not match_query:
+        return pd.DataFrame(columns=['driverid', 'forename', 'surname', 'race_count', 'full_name'])
+    query = text("""
+        SELECT s.driverid, s.forename, s.surname, a.race_count
+        FROM driver_search_fts f
+        JOIN driver_search s ON s.rowid = f.docid
+        LEFT JOIN driver_all_time_u0_ranking_conservative a ON a.driverid = s.driverid
+        WHERE driver_search_fts MATCH :match_query
+        ORDER BY a.race_count DESC, s.surname
+        LIMIT :limit;
+    """)
+    with _engine.connect() as conn:
+        df = pd.read_sql(query, conn, params={'match_query': match_query, 'limit': limit})
+    df['full_name'] = df['forename'] + ' ' + df['surname']
+    return df
+
+
+@st.cache_data
+@shared_cache
+def get_driver_profile(_engine, driverid, db_version=None):
+    """
+    Loads all-time skill, yearly skill and yearly POE history for one driver.
+    All three queries run on a single connection against the sidecar index's
+    copies of the tables, using their driverid indexes.
+    Column names match the Red Bull post loaders so the same plots can be reused.
+    """
+    all_time_query = text("""
+        SELECT forename, surname, u0_skill_mean, u0_skill_lower_bound, race_count
+        FROM driver_all_time_u0_ranking_conservative
+        WHERE driverid = :driverid;
+    """)
+    yearly_query = text("""
+        SELECT year, forename, surname, yearly_pure_skill_score, yearly_rank
+        FROM driver_yearly_pure_skill_rankings
+        WHERE driverid = :driverid
+        ORDER BY year;
+    """)
+    poe_query = text("""
+        SELECT
+            forename,
+            surname,
+            year,
+            AVG(performance_over_expectation) as average_poe,
+            COUNT(raceid) as race_count
+        FROM driver_performance_over_expectation
+        WHERE driverid = :driverid
+        GROUP BY forename, surname, year
+        ORDER BY year;
+    """)
+    params = {'driverid': driverid}
+    with _engine.connect() as conn:
+        profile = {
+            'all_time_skill': pd.read_sql(all_time_query, conn, params=params),
+            'yearly_skill': pd.read_sql(yearly_query, conn, params=params),
+            'yearly_poe': pd.read_sql(poe_query, conn, params=params),
+        }
+    for df in profile.values():
+        if not df.empty:
+            df['full_name'] = df['forename'] + ' ' + df['surname']
+    return profile
+
 # --- Data Loading Functions ---
 @st.cache_data
-def load_data(table_name):
+@shared_cache
+def load_data(table_name, db_version=None):
     """Generic function to load a table from the database."""
     try:
         df = pd.read_sql_table(table_name, engine)
@@ -59,38 +468,44 @@ def load_data(table_name):
         return pd.DataFrame()
 
 # --- NEW: Specific Data Loading for Red Bull Post ---
+RED_BULL_POST_DRIVERS = ('sergio-perez', 'liam-lawson', 'yuki-tsunoda', 'isack-hadjar', 'max-verstappen')
+RED_BULL_YEARLY_DRIVERS = ('sergio-perez', 'yuki-tsunoda', 'liam-lawson')
+
 @st.cache_data
-def get_all_time_skill_data(_engine):
+@shared_cache
+def get_all_time_skill_data(_engine, driver_ids=RED_BULL_POST_DRIVERS, db_version=None):
     """Fetches all-time conservative and mean skill rankings for specific drivers."""
     query = text("""
         SELECT forename, surname, u0_skill_mean, u0_skill_lower_bound, race_count 
         FROM driver_all_time_u0_ranking_conservative 
-        WHERE driverid IN ('sergio-perez', 'liam-lawson', 'yuki-tsunoda', 'isack-hadjar', 'max-verstappen')
+        WHERE driverid IN :driver_ids
         ORDER BY u0_skill_lower_bound DESC;
-    """)
+    """).bindparams(bindparam('driver_ids', expanding=True))
     with _engine.connect() as conn:
-        df = pd.read_sql(query, conn)
+        df = pd.read_sql(query, conn, params={'driver_ids': list(driver_ids)})
     if not df.empty:
         df['full_name'] = df['forename'] + ' ' + df['surname']
     return df
 
 @st.cache_data
-def get_yearly_skill_data(_engine):
+@shared_cache
+def get_yearly_skill_data(_engine, driver_ids=RED_BULL_YEARLY_DRIVERS, db_version=None):
     """Fetches yearly skill scores for Pérez, Tsunoda and Lawson."""
     query = text("""
         SELECT year, forename, surname, yearly_pure_skill_score, yearly_rank 
         FROM driver_yearly_pure_skill_rankings 
-        WHERE driverid IN ('sergio-perez', 'yuki-tsunoda', 'liam-lawson') AND year >= 2021
+        WHERE driverid IN :driver_ids AND year >= 2021
         ORDER BY surname, year;
-    """)
+    """).bindparams(bindparam('driver_ids', expanding=True))
     with _engine.connect() as conn:
-        df = pd.read_sql(query, conn)
+        df = pd.read_sql(query, conn, params={'driver_ids': list(driver_ids)})
     if not df.empty:
         df['full_name'] = df['forename'] + ' ' + df['surname']
     return df
 
 @st.cache_data
-def get_poe_data(_engine):
+@shared_cache
+def get_poe_data(_engine, driver_ids=RED_BULL_POST_DRIVERS, db_version=None):
     """
     Fetches the average performance over expectation for specific drivers for each
     year between 2021 and 2024.
@@ -105,22 +520,23 @@ def get_poe_data(_engine):
         FROM 
             driver_performance_over_expectation 
         WHERE 
-            driverid IN ('sergio-perez', 'liam-lawson', 'yuki-tsunoda', 'isack-hadjar', 'max-verstappen') 
+            driverid IN :driver_ids
             AND year BETWEEN 2021 AND 2025
         GROUP BY 
             forename, surname, year
         ORDER BY 
             surname, year;
-    """)
+    """).bindparams(bindparam('driver_ids', expanding=True))
     with _engine.connect() as conn:
-        df = pd.read_sql(query, conn)
+        df = pd.read_sql(query, conn, params={'driver_ids': list(driver_ids)})
     if not df.empty:
         df['full_name'] = df['forename'] + ' ' + df['surname']
     return df
 
 
 @st.cache_data
-def get_latest_year_poe_data(_engine):
+@shared_cache
+def get_latest_year_poe_data(_engine, db_version=None):
     """
     Fetches Performance Over Expectation data for all drivers for the most
     recent year available in the database.
@@ -444,22 +860,24 @@ LIMIT 10;"""
                 # Display database or syntax errors to the user
                 st.error(f"An error occurred while executing the query: {e}", icon="❌")
 
-def render_red_bull_post(_engine):
+@st.cache_data
+@shared_cache
+def render_red_bull_post(_engine, db_version=None):
     """Loads data and creates all plots for the Red Bull post."""
     plots = {}
     
     # All-Time Skill Plot
-    df_all_time = get_all_time_skill_data(_engine)
+    df_all_time = get_all_time_skill_data(_engine, db_version=db_version)
     if not df_all_time.empty:
         plots['all_time_skill'] = plot_all_time_skill(df_all_time)
 
     # Yearly Skill Plot
-    df_yearly = get_yearly_skill_data(_engine)
+    df_yearly = get_yearly_skill_data(_engine, db_version=db_version)
     if not df_yearly.empty:
         plots['yearly_skill_comparison'] = plot_yearly_skill_comparison(df_yearly)
         
     # POE Plot
-    df_poe = get_poe_data(_engine)
+    df_poe = get_poe_data(_engine, db_version=db_version)
     if not df_poe.empty:
         plots['yearly_poe_trend'] = plot_yearly_poe_trend(df_poe)
         
@@ -489,7 +907,7 @@ def render_poe_explanation_text():
         **Conclusion:** The C+ student had the bigger *surprise* (a higher POE score), but the A+ student still achieved the better absolute result. When looking at the table, a high POE score means that driver had a surprisingly great day.
         """)
 
-def render_latest_poe_post(engine):
+def render_latest_poe_post(engine, db_version=None):
     """
     Loads data and creates an INTERACTIVE plot for the latest year's POE review,
     allowing the user to select which drivers to display.
@@ -497,7 +915,7 @@ def render_latest_poe_post(engine):
     plots = {}
     
     # We still load ALL the data for the year initially
-    df_latest_poe = get_latest_year_poe_data(engine)
+    df_latest_poe = get_latest_year_poe_data(engine, db_version=db_version)
     
     if not df_latest_poe.empty:
         # --- INTERACTIVITY WIDGET ---
@@ -634,7 +1052,7 @@ with blog_tab:
             if post_filename in POST_RENDERERS:
                 # This post has a special renderer function
                 renderer_func = POST_RENDERERS[post_filename]
-                plots = renderer_func(engine)
+                plots = renderer_func(engine, db_version=db_version)
                 render_markdown_with_plots(post_content, plots)
             else:
                 # Default behavior for simple markdown posts
@@ -648,7 +1066,7 @@ with dataviz_tab:
 
     with st.expander("🏆 All-Time Driver Rankings", expanded=True):
         st.markdown("Drivers are ranked by their `u0_skill_lower_bound`, a conservative estimate of their baseline skill. This rewards consistent, high-level performance over a career.")
-        df_all_time = load_data("driver_all_time_u0_ranking_conservative")
+        df_all_time = load_data("driver_all_time_u0_ranking_conservative", db_version=db_version)
         if not df_all_time.empty:
             top_n = st.slider("Select number of top drivers:", min_value=10, max_value=100, value=25, key="all_time_slider")
             df_display = df_all_time.head(top_n).sort_values(by="u0_skill_lower_bound", ascending=True)
@@ -658,7 +1076,7 @@ with dataviz_tab:
 
     with st.expander("📅 Yearly 'Pure Skill' Rankings"):
         st.markdown("Explore the model's estimate of driver skill for any given season, accounting for age and experience.")
-        df_yearly = load_data("driver_yearly_pure_skill_rankings")
+        df_yearly = load_data("driver_yearly_pure_skill_rankings", db_version=db_version)
         if not df_yearly.empty:
             years = sorted(df_yearly['year'].unique(), reverse=True)
             selected_year = st.selectbox("Select a Year:", options=years)
@@ -670,7 +1088,7 @@ with dataviz_tab:
 
     with st.expander("🔮 2025 Teammate Head-to-Head Predictions"):
         st.markdown("This table shows the model's predictions for potential 2025 teammate battles. The probabilities reflect which driver is more likely to have a higher 'pure skill' score.")
-        df_h2h = load_data("predictions_h2h_2025")
+        df_h2h = load_data("predictions_h2h_2025", db_version=db_version)
         if not df_h2h.empty:
             df_h2h['constructor_id'] = df_h2h['constructor_id'].str.replace('-', ' ').str.title()
             for _, row in df_h2h.iterrows():
@@ -688,9 +1106,42 @@ with dataviz_tab:
                 st.progress(d1_prob_float)
                 st.divider()
 
+    with st.expander("🔎 Driver Profiles"):
+        st.markdown("Search any driver in the model by name or driver id to see their all-time skill, yearly skill and Performance Over Expectation history.")
+        if driver_index_engine is None:
+            st.warning("Driver search is unavailable because the search index could not be built.")
+        else:
+            search_text = st.text_input("Search drivers:", value="Verstappen", key="driver_search_input")
+            df_matches = search_drivers(driver_index_engine, search_text, db_version=db_version)
+            if df_matches.empty:
+                st.info("No drivers match your search.")
+            else:
+                driver_names = dict(zip(df_matches['driverid'], df_matches['full_name']))
+                selected_driverid = st.selectbox("Select a driver:", options=list(driver_names.keys()), format_func=driver_names.get, key="driver_profile_select")
+                selected_driver = driver_names[selected_driverid]
+                profile = get_driver_profile(driver_index_engine, selected_driverid, db_version=db_version)
+
+                df_profile_all_time = profile['all_time_skill']
+                if not df_profile_all_time.empty:
+                    row = df_profile_all_time.iloc[0]
+                    col1, col2, col3 = st.columns(3)
+                    with col1: st.metric(label="Conservative Skill", value=f"{row['u0_skill_lower_bound']:.3f}")
+                    with col2: st.metric(label="Mean Skill", value=f"{row['u0_skill_mean']:.3f}")
+                    with col3: st.metric(label="Races", value=int(row['race_count']))
+
+                df_profile_yearly = profile['yearly_skill']
+                if not df_profile_yearly.empty:
+                    fig = px.line(df_profile_yearly, x='year', y='yearly_pure_skill_score', title=f"Yearly Pure Skill: {selected_driver}", labels={"year": "Season", "yearly_pure_skill_score": "Yearly Pure Skill Score"}, markers=True, hover_data=["yearly_rank"])
+                    fig.update_layout(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
+                    st.plotly_chart(fig, use_container_width=True)
+
+                df_profile_poe = profile['yearly_poe']
+                if not df_profile_poe.empty:
+                    st.plotly_chart(plot_yearly_poe_trend(df_profile_poe), use_container_width=True)
+
     with st.expander("⚙️ Model Internals"):
         st.markdown("This table shows the raw summary output from the Bayesian model, which is useful for diagnosing the model's performance and understanding parameter distributions.")
-        df_summary = load_data("model_summary")
+        df_summary = load_data("model_summary", db_version=db_version)
         if not df_summary.empty:
             st.dataframe(df_summary, height=500)
 